@@ -3,18 +3,21 @@ import sys
 import os
 import subprocess
 import time
-import json
-import shutil
 import re
-from statistics import mean
+import fcntl
+import struct
 
 INSTALL_META_PATH = "/usr/local/share/aiov2_ctl/install.json"
 CONFIG_PATH = "/usr/local/share/aiov2_ctl/config.json"
 USER_CONFIG_PATH = os.path.expanduser("~/.config/aiov2_ctl/config.json")
+UPDATE_CHECK_CACHE_PATH = os.path.expanduser("~/.cache/aiov2_ctl/update_check.json")
+UPDATE_CHECK_TTL = 3600  # seconds
 RAILS_BOOT_SERVICE = "aiov2-rails-boot.service"
 RAILS_BOOT_SERVICE_PATH = f"/etc/systemd/system/{RAILS_BOOT_SERVICE}"
 
 def rerun_with_sudo(extra_args=None):
+    import shutil
+
     python3 = shutil.which("python3") or "/usr/bin/python3"
 
     cmd = ["sudo", python3, os.path.realpath(__file__)]
@@ -46,17 +49,29 @@ def run_cmd(cmd, cwd=None):
         return False
 
 def get_git_root():
-    try:
-        return subprocess.check_output(
-            ["git", "rev-parse", "--show-toplevel"],
-            stderr=subprocess.DEVNULL,
-            text=True
-        ).strip()
-    except subprocess.CalledProcessError:
-        return None
+    # Walking parents for a .git entry answers "which repo am I in?"
+    # without forking git
+    path = os.getcwd()
+    while True:
+        if os.path.exists(os.path.join(path, ".git")):
+            return path
+        parent = os.path.dirname(path)
+        if parent == path:
+            return None
+        path = parent
 
 
 def get_git_branch(repo):
+    # The common case reads .git/HEAD directly; detached HEADs and
+    # worktree layouts fall back to git itself
+    try:
+        with open(os.path.join(repo, ".git", "HEAD")) as f:
+            head = f.read().strip()
+        if head.startswith("ref: refs/heads/"):
+            return head[len("ref: refs/heads/"):]
+    except OSError:
+        pass
+
     try:
         return subprocess.check_output(
             ["git", "rev-parse", "--abbrev-ref", "HEAD"],
@@ -68,6 +83,8 @@ def get_git_branch(repo):
 
 
 def load_install_meta():
+    import json
+
     try:
         with open(INSTALL_META_PATH) as f:
             return json.load(f)
@@ -75,6 +92,8 @@ def load_install_meta():
         return None
 
 def load_config():
+    import json
+
     config = {}
     for path in (CONFIG_PATH, USER_CONFIG_PATH):
         try:
@@ -86,6 +105,8 @@ def load_config():
 
 
 def load_system_config():
+    import json
+
     try:
         with open(CONFIG_PATH) as f:
             return json.load(f)
@@ -93,6 +114,8 @@ def load_system_config():
         return {}
 
 def save_config(config):
+    import json
+
     try:
         os.makedirs(os.path.dirname(CONFIG_PATH), exist_ok=True)
         with open(CONFIG_PATH, "w") as f:
@@ -148,10 +171,22 @@ def apply_rails_on_boot(announce=False):
     if announce:
         print("Applying GPIO rail boot states...")
 
-    for feature in GPIO_MAP:
-        desired = bool(rails.get(feature, False))
-        GpioController.set_feature(feature, desired)
-        if announce:
+    # Plain rails land in one batched write; LORA goes through set_feature
+    # so the meshtasticd service handling stays attached to it.
+    # This runs from a Type=oneshot unit, so the writes must stay on the
+    # pinctrl path (never hold_lines here): a line request would be
+    # released the moment the process exits, reverting every rail to
+    # input right after boot.
+    GpioController.set_gpios(
+        (GPIO_MAP[feature], bool(rails.get(feature, False)))
+        for feature in GPIO_MAP
+        if feature != "LORA"
+    )
+    GpioController.set_feature("LORA", bool(rails.get("LORA", False)))
+
+    if announce:
+        for feature in GPIO_MAP:
+            desired = bool(rails.get(feature, False))
             print(f"  {feature:<5} -> {'ON' if desired else 'OFF'}")
 
     return 0
@@ -313,9 +348,14 @@ complete -F _aiov2_ctl aiov2_ctl
 
 
 
+# Cursor-home + erase-display; honored in SSH, local TTY, tmux without
+# forking a shell + clear per redraw.
+CLEAR_SCREEN = "\x1b[H\x1b[2J"
+
+
 def clear_screen():
-    # Works in SSH, local TTY, tmux
-    os.system("clear")
+    sys.stdout.write(CLEAR_SCREEN)
+    sys.stdout.flush()
 
 def draw_header(title=None):
     clear_screen()
@@ -336,6 +376,10 @@ GPIO_MAP = {
     "USB": 23,
 }
 
+# Frozen view for the polling loops — tuple iteration avoids rebuilding a
+# dict-items iterator on every tick
+GPIO_ITEMS = tuple(GPIO_MAP.items())
+
 # If pinctrl reports level "--" (not driven), fall back to a boot default.
 # Keep this per-pin; do NOT infer state using "no pu" globally.
 BOOT_DEFAULTS = {
@@ -355,6 +399,31 @@ FEATURE_META = {
 BATTERY_SUPPLY = "axp20x-battery"
 AC_SUPPLY = "axp22x-ac"
 
+# Supply topology is fixed after boot; build the sysfs paths once instead
+# of re-formatting them on every sample.
+_BATTERY_BASE = f"/sys/class/power_supply/{BATTERY_SUPPLY}"
+AC_ONLINE_PATH = f"/sys/class/power_supply/{AC_SUPPLY}/online"
+BATTERY_STATUS_PATH = f"{_BATTERY_BASE}/status"
+BATTERY_CAPACITY_PATH = f"{_BATTERY_BASE}/capacity"
+BATTERY_VOLTAGE_PATH = f"{_BATTERY_BASE}/voltage_now"
+BATTERY_CURRENT_PATH = f"{_BATTERY_BASE}/current_now"
+
+# GPIO character device (uapi v2). Holding one line request for all pins
+# turns every read/write into a single ioctl instead of a pinctrl fork.
+GPIO_CHIP = "/dev/gpiochip0"
+
+GPIO_V2_GET_LINE_IOCTL = 0xC250B407
+GPIO_V2_LINE_GET_VALUES_IOCTL = 0xC010B40E
+GPIO_V2_LINE_SET_VALUES_IOCTL = 0xC010B40F
+
+GPIO_V2_LINE_FLAG_OUTPUT = 1 << 3
+GPIO_V2_LINE_ATTR_ID_OUTPUT_VALUES = 2
+
+# struct gpio_v2_line_request layout (592 bytes):
+#   offsets[64] u32 @ 0, consumer[32] @ 256, config @ 288
+#   (flags u64, num_attrs u32, pad, attrs[10] @ 320), num_lines @ 560, fd @ 588
+_LINE_REQUEST_SIZE = 592
+
 
 
 
@@ -417,9 +486,12 @@ General
 # ==============================
 # Help text
 # ==============================
-HELP_TEXT = (
-    APP_HEADER
-    + """
+def help_text():
+    # Assembled on demand: the common no-arg and FEATURE on/off
+    # invocations never pay for building it
+    return (
+        APP_HEADER
+        + """
 USAGE:
   aiov2_ctl
   aiov2_ctl --status
@@ -470,8 +542,8 @@ NOTES:
   • GUI left-click opens status window
   • GUI right-click opens menu
 """
-    + POST_INSTALL_TIPS
-)
+        + POST_INSTALL_TIPS
+    )
 
 
 
@@ -559,6 +631,10 @@ def add_apps():
 
     subprocess.check_call(["apt", "update"])
 
+    # Two transactions on purpose: --install-recommends is scoped to the
+    # board package only, and apt can't express per-package recommends in
+    # a single call - merging them would pull the app bundle's recommends
+    # on systems that disable APT::Install-Recommends
     subprocess.check_call([
         "apt", "--install-recommends",
         "install",
@@ -589,26 +665,18 @@ def remove_apps():
 
     draw_header("Removing HackerGadgets AIO applications")
 
+    # Single transaction; --autoremove folds in the trailing cleanup pass
     subprocess.call([
         "apt", "remove",
+        "--autoremove",
         "meshtastic-mui",
         "sdrpp-brown",
         "tar1090",
         "pygpsclient",
-        "-y"
-    ])
-
-    subprocess.call([
-        "apt", "remove",
         "hackergadgets-uconsole-aio-board",
         "-y"
     ])
 
-    subprocess.call([
-        "apt", "autoremove",
-        "-y"
-    ])
-
     print("\nApplications removed.")
     return 0
 
@@ -620,6 +688,8 @@ def sync_rtc():
         print("Run: sudo aiov2_ctl --sync-rtc")
         return 1
 
+    import shutil
+
     if not shutil.which("hwclock"):
         print("hwclock not found. RTC sync skipped.")
         return 1
@@ -630,6 +700,11 @@ def sync_rtc():
     return 0
 
 
+# One alternation compiled once: a pinctrl line carries a single level
+# token, so the first match is the answer and one scan replaces three
+_PINCTRL_LEVEL_RE = re.compile(r"\b(?:hi|lo)\b|(?<!\S)--(?!\S)")
+
+
 def parse_pinctrl_level(out: str):
     """
     Extract pin level from `pinctrl get <pin>` output.
@@ -638,27 +713,178 @@ def parse_pinctrl_level(out: str):
     if not out:
         return None
 
-    if re.search(r"\bhi\b", out):
-        return "hi"
-    if re.search(r"\blo\b", out):
-        return "lo"
-    if re.search(r"(?<!\S)--(?!\S)", out):
-        return "--"
-
-    return None
+    m = _PINCTRL_LEVEL_RE.search(out)
+    return m.group() if m else None
 
 
 # ==============================
 # GPIO Helpers
 # ==============================
 class GpioController:
+    # Cached gpio_v2 line-request fd (None = untried, -1 = unavailable)
+    _line_fd = None
+    # pin -> bit index within the line request
+    _line_index = {}
+    # The chardev backend is opt-in (hold_lines), for long-lived processes
+    # only. On the stock uConsole kernels gpiolib reverts a line to input
+    # when its request is released (persist_gpio_outputs is not set), so a
+    # one-shot invocation that took the lines would drop every rail the
+    # moment it exited - and a read-only command requesting outputs would
+    # actively drive pins that pinctrl reports as undriven. One-shots
+    # therefore always go through pinctrl, which pokes the pads outside
+    # gpiolib and persists.
+    _holding = False
+    # Shadow of the last known pin states, maintained by set_gpio/read_all.
+    # Long-lived pollers (the GUI) can serve ticks from this and resync
+    # from hardware only when brought to the foreground.
+    _state = {}
+
+    @classmethod
+    def hold_lines(cls):
+        """Take ownership of the rail lines for this process's lifetime.
+
+        Call once from the main thread before any worker thread can reach
+        the controller; the cached request fd then serves every later
+        call. Pair with release_lines() on shutdown.
+        """
+        cls._holding = True
+        return cls._open_lines()
+
+    @classmethod
+    def release_lines(cls):
+        fd = cls._line_fd
+        cls._line_fd = None
+        cls._holding = False
+        if fd is None or fd < 0:
+            return
+
+        # Closing the request reverts the lines to inputs, so drop it
+        # first and then re-drive the rails through pinctrl, which
+        # persists. The gap is a few milliseconds.
+        try:
+            os.close(fd)
+        except OSError:
+            pass
+
+        on_pins = [str(p) for p, s in cls._state.items() if s]
+        off_pins = [str(p) for p, s in cls._state.items() if not s]
+        if on_pins:
+            cls.spawn(["pinctrl", "set", ",".join(on_pins), "op", "dh"])
+        if off_pins:
+            cls.spawn(["pinctrl", "set", ",".join(off_pins), "op", "dl"])
+
+    @classmethod
+    def _open_lines(cls):
+        if not cls._holding:
+            return None
+        if cls._line_fd is not None:
+            return cls._line_fd if cls._line_fd >= 0 else None
+
+        pins = tuple(GPIO_MAP.values())
+        index = {pin: i for i, pin in enumerate(pins)}
+
+        # Seed output values from the current pin states so requesting the
+        # lines does not glitch rails that are already powered.
+        bits = 0
+        for pin, i in index.items():
+            state, _ = GpioController._pinctrl_state(pin)
+            if state:
+                bits |= 1 << i
+
+        req = bytearray(_LINE_REQUEST_SIZE)
+        struct.pack_into(f"<{len(pins)}L", req, 0, *pins)
+        struct.pack_into("<32s", req, 256, b"aiov2_ctl")
+        struct.pack_into("<QL", req, 288, GPIO_V2_LINE_FLAG_OUTPUT, 1)
+        struct.pack_into(
+            "<LLQQ", req, 320,
+            GPIO_V2_LINE_ATTR_ID_OUTPUT_VALUES, 0,
+            bits, (1 << len(pins)) - 1,
+        )
+        struct.pack_into("<L", req, 560, len(pins))
+
+        try:
+            chip_fd = os.open(GPIO_CHIP, os.O_RDWR)
+            try:
+                fcntl.ioctl(chip_fd, GPIO_V2_GET_LINE_IOCTL, req)
+            finally:
+                os.close(chip_fd)
+            cls._line_fd = struct.unpack_from("<i", req, 588)[0]
+            cls._line_index = index
+        except OSError:
+            cls._line_fd = -1
+            return None
+
+        return cls._line_fd
+
+    # argv[0] -> resolved executable path, so repeat calls skip PATH search
+    _exe_cache = {}
+
     @staticmethod
     def run(cmd):
+        # posix_spawn with a raw pipe is markedly lighter than the full
+        # subprocess.Popen machinery for these tiny helper commands
+        exe = GpioController._exe_cache.get(cmd[0])
+        if exe is None:
+            import shutil
+
+            exe = shutil.which(cmd[0])
+            if exe is None:
+                return None
+            GpioController._exe_cache[cmd[0]] = exe
+
         try:
-            return subprocess.check_output(cmd, text=True).strip()
-        except Exception:
+            r, w = os.pipe()
+        except OSError:
+            return None
+
+        try:
+            pid = os.posix_spawn(
+                exe, cmd, os.environ,
+                file_actions=[
+                    (os.POSIX_SPAWN_DUP2, w, 1),
+                    (os.POSIX_SPAWN_CLOSE, r),
+                ],
+            )
+        except OSError:
+            os.close(r)
+            os.close(w)
             return None
 
+        os.close(w)
+        chunks = []
+        while True:
+            buf = os.read(r, 4096)
+            if not buf:
+                break
+            chunks.append(buf)
+        os.close(r)
+
+        _, status = os.waitpid(pid, 0)
+        if os.waitstatus_to_exitcode(status) != 0:
+            return None
+
+        return b"".join(chunks).decode(errors="replace").strip()
+
+    @staticmethod
+    def spawn(cmd):
+        # Fire-and-forget variant of run(): no pipe, no stdout capture.
+        exe = GpioController._exe_cache.get(cmd[0])
+        if exe is None:
+            import shutil
+
+            exe = shutil.which(cmd[0])
+            if exe is None:
+                return False
+            GpioController._exe_cache[cmd[0]] = exe
+
+        try:
+            pid = os.posix_spawn(exe, cmd, os.environ)
+        except OSError:
+            return False
+
+        _, status = os.waitpid(pid, 0)
+        return os.waitstatus_to_exitcode(status) == 0
+
     @staticmethod
     def _service_active(name):
         cmd = ["systemctl", "is-active", "--quiet", name]
@@ -701,7 +927,19 @@ class GpioController:
 
     @staticmethod
     def set_gpio(pin, state):
-        subprocess.call([
+        GpioController._state[pin] = bool(state)
+
+        fd = GpioController._open_lines()
+        if fd is not None and pin in GpioController._line_index:
+            mask = 1 << GpioController._line_index[pin]
+            buf = bytearray(struct.pack("<QQ", mask if state else 0, mask))
+            try:
+                fcntl.ioctl(fd, GPIO_V2_LINE_SET_VALUES_IOCTL, buf)
+                return
+            except OSError:
+                pass
+
+        GpioController.spawn([
             "pinctrl",
             "set",
             str(pin),
@@ -709,6 +947,42 @@ class GpioController:
             "dh" if state else "dl",
         ])
 
+    @staticmethod
+    def set_gpios(pairs):
+        """Set several pins at once; pairs is an iterable of (pin, state).
+
+        On the gpiochip backend this is one atomic SET_VALUES ioctl; the
+        pinctrl fallback groups pins by target level so at most two
+        invocations cover any batch.
+        """
+        pairs = list(pairs)
+        for pin, state in pairs:
+            GpioController._state[pin] = bool(state)
+
+        fd = GpioController._open_lines()
+        index = GpioController._line_index
+        if fd is not None and all(pin in index for pin, _ in pairs):
+            bits = 0
+            mask = 0
+            for pin, state in pairs:
+                bit = 1 << index[pin]
+                mask |= bit
+                if state:
+                    bits |= bit
+            buf = bytearray(struct.pack("<QQ", bits, mask))
+            try:
+                fcntl.ioctl(fd, GPIO_V2_LINE_SET_VALUES_IOCTL, buf)
+                return
+            except OSError:
+                pass
+
+        on_pins = [str(pin) for pin, state in pairs if state]
+        off_pins = [str(pin) for pin, state in pairs if not state]
+        if on_pins:
+            GpioController.spawn(["pinctrl", "set", ",".join(on_pins), "op", "dh"])
+        if off_pins:
+            GpioController.spawn(["pinctrl", "set", ",".join(off_pins), "op", "dl"])
+
     @staticmethod
     def set_feature(feature, state):
         pin = GPIO_MAP.get(feature)
@@ -736,6 +1010,80 @@ class GpioController:
 
     @staticmethod
     def get_pin_state(pin):
+        fd = GpioController._open_lines()
+        if fd is not None and pin in GpioController._line_index:
+            mask = 1 << GpioController._line_index[pin]
+            buf = bytearray(struct.pack("<QQ", 0, mask))
+            try:
+                fcntl.ioctl(fd, GPIO_V2_LINE_GET_VALUES_IOCTL, buf)
+                bits = struct.unpack_from("<Q", buf, 0)[0]
+                return bool(bits & mask), "gpiochip"
+            except OSError:
+                pass
+
+        return GpioController._pinctrl_state(pin)
+
+    @staticmethod
+    def read_all(use_cache=False):
+        """Read every GPIO_MAP pin in one operation; returns {pin: bool}.
+
+        With use_cache=True, serve the in-process shadow state when it is
+        fully populated — valid for pollers as long as all rail changes in
+        this process go through set_gpio.
+        """
+        if use_cache and len(GpioController._state) == len(GPIO_MAP):
+            return dict(GpioController._state)
+
+        fd = GpioController._open_lines()
+        if fd is not None:
+            index = GpioController._line_index
+            mask = (1 << len(index)) - 1
+            buf = bytearray(struct.pack("<QQ", 0, mask))
+            try:
+                fcntl.ioctl(fd, GPIO_V2_LINE_GET_VALUES_IOCTL, buf)
+                bits = struct.unpack_from("<Q", buf, 0)[0]
+                result = {pin: bool(bits & (1 << i)) for pin, i in index.items()}
+                GpioController._state = dict(result)
+                return result
+            except OSError:
+                pass
+
+        # Fallback: one pinctrl invocation for all pins instead of N forks
+        pins = tuple(GPIO_MAP.values())
+        out = GpioController.run(["pinctrl", "get", ",".join(map(str, pins))])
+        states = {}
+        if out:
+            for line in out.splitlines():
+                head, sep, _ = line.partition(":")
+                if not sep:
+                    continue
+                try:
+                    pin = int(head.strip())
+                except ValueError:
+                    continue
+                level = parse_pinctrl_level(line)
+                if level == "hi":
+                    states[pin] = True
+                elif level == "lo":
+                    states[pin] = False
+                elif level == "--":
+                    states[pin] = bool(BOOT_DEFAULTS.get(pin, False))
+
+        result = {
+            pin: states[pin] if pin in states else GpioController._pinctrl_state(pin)[0]
+            for pin in pins
+        }
+        GpioController._state = dict(result)
+        return result
+
+    @staticmethod
+    def get_states(use_cache=False):
+        """Batched feature -> state map for pollers."""
+        by_pin = GpioController.read_all(use_cache)
+        return {f: by_pin[p] for f, p in GPIO_ITEMS}
+
+    @staticmethod
+    def _pinctrl_state(pin):
         out = GpioController.run(["pinctrl", "get", str(pin)])
         level = parse_pinctrl_level(out)
 
@@ -755,56 +1103,85 @@ class GpioController:
 # ==============================
 # Telemetry
 # ==============================
+# (mode, direction) lookup indexed by 3*ac + sign(current)+1 — replaces the
+# branchy classifier that ran on every power_summary call
+_POWER_MODES = (
+    ("Battery powering system", "discharging"),
+    ("Battery powering system", "idle"),
+    ("Battery powering system", "charging"),
+    ("AC powering system", "discharging"),
+    ("AC powering system", "idle"),
+    ("AC powering system + battery", "charging"),
+)
+
+
 class Telemetry:
+    # sysfs attribute fds are kept open for the process lifetime; each
+    # sample is then one pread instead of an open/read/close triplet.
+    # A path that failed to open is cached as -1 (the supply nodes are
+    # fixed at boot, so there is no point re-raising ENOENT every tick).
+    _fd_cache = {}
+
+    @staticmethod
+    def _read_raw(path):
+        fd = Telemetry._fd_cache.get(path)
+        if fd == -1:
+            return None
+        try:
+            if fd is None:
+                fd = os.open(path, os.O_RDONLY)
+                Telemetry._fd_cache[path] = fd
+            return os.pread(fd, 32, 0)
+        except OSError:
+            if fd is None:
+                Telemetry._fd_cache[path] = -1
+            else:
+                Telemetry._fd_cache.pop(path, None)
+                try:
+                    os.close(fd)
+                except OSError:
+                    pass
+            return None
+
     @staticmethod
     def _read_int(path):
+        buf = Telemetry._read_raw(path)
         try:
-            with open(path) as f:
-                return int(f.read().strip())
-        except Exception:
+            return int(buf)
+        except (TypeError, ValueError):
             return None
 
     @staticmethod
     def ac_online():
-        v = Telemetry._read_int(
-            f"/sys/class/power_supply/{AC_SUPPLY}/online"
-        )
+        v = Telemetry._read_int(AC_ONLINE_PATH)
         return bool(v) if v is not None else None
 
     @staticmethod
     def battery_status():
-        try:
-            with open(
-                f"/sys/class/power_supply/{BATTERY_SUPPLY}/status"
-            ) as f:
-                return f.read().strip()
-        except Exception:
+        buf = Telemetry._read_raw(BATTERY_STATUS_PATH)
+        if buf is None:
             return None
+        return buf.decode().strip()
 
     @staticmethod
     def battery_capacity():
-        return Telemetry._read_int(
-            f"/sys/class/power_supply/{BATTERY_SUPPLY}/capacity"
-        )
+        return Telemetry._read_int(BATTERY_CAPACITY_PATH)
 
     @staticmethod
     def battery_v_i_w():
-        v = Telemetry._read_int(
-            f"/sys/class/power_supply/{BATTERY_SUPPLY}/voltage_now"
-        )
-        i = Telemetry._read_int(
-            f"/sys/class/power_supply/{BATTERY_SUPPLY}/current_now"
-        )
+        v = Telemetry._read_int(BATTERY_VOLTAGE_PATH)
+        i = Telemetry._read_int(BATTERY_CURRENT_PATH)
         if v is None or i is None:
             return None
 
         v /= 1e6
         i /= 1e6
 
+        # Raw values; rounding is presentation and happens at display time
         return {
-            "voltage": round(v, 2),
-            "current": round(i, 2),      # signed
-            "power": round(v * i, 2),    # signed
+            "voltage": v,
+            "current": i,      # signed
+            "power": v * i,    # signed
         }
 
     @staticmethod
@@ -819,19 +1196,8 @@ class Telemetry:
 
         cur = viw["current"]
 
-        if cur > 0.05:
-            direction = "charging"
-        elif cur < -0.05:
-            direction = "discharging"
-        else:
-            direction = "idle"
-
-        if ac and direction == "charging":
-            mode = "AC powering system + battery"
-        elif ac:
-            mode = "AC powering system"
-        else:
-            mode = "Battery powering system"
+        idx = (3 if ac else 0) + (cur > 0.05) - (cur < -0.05) + 1
+        mode, direction = _POWER_MODES[idx]
 
         return {
             "source": "AC" if ac else "BAT",
@@ -839,68 +1205,134 @@ class Telemetry:
             "capacity": cap,
             "direction": direction,
             "mode": mode,
-            "voltage": viw["voltage"],
+            "voltage": round(viw["voltage"], 2),
             "current": round(abs(cur), 2),
             "power": round(abs(viw["power"]), 2),
         }
 
+    _snapshot = None
+    _snapshot_t = 0.0
+
+    @staticmethod
+    def snapshot(max_age=0.5):
+        """power_summary memoized for max_age seconds.
+
+        Consumers that fire within the same tick (tray line, status
+        window, tooltip) share one set of sysfs reads instead of each
+        re-sampling the hardware.
+        """
+        now = time.monotonic()
+        if Telemetry._snapshot is None or now - Telemetry._snapshot_t > max_age:
+            Telemetry._snapshot = Telemetry.power_summary()
+            Telemetry._snapshot_t = now
+        return Telemetry._snapshot
+
 # ==============================
 # Status (snapshot)
 # ==============================
 def show_status():
-    print("AIO v2 Status")
-    print("====================")
+    lines = ["AIO v2 Status", "===================="]
 
     debug = os.environ.get("AIOV2_CTL_DEBUG") == "1"
 
-    for f, p in GPIO_MAP.items():
-        state_bool, source = GpioController.get_pin_state(p)
-        state = "ON" if state_bool else "OFF"
-        if debug:
-            print(f"{f:<5} GPIO{p}: {state} ({source})")
-        else:
-            print(f"{f:<5} GPIO{p}: {state}")
+    if debug:
+        # Per-pin reads keep the state-source annotation
+        for f, p in GPIO_ITEMS:
+            state_bool, source = GpioController.get_pin_state(p)
+            state = "ON" if state_bool else "OFF"
+            lines.append(f"{f:<5} GPIO{p}: {state} ({source})")
+    else:
+        states = GpioController.read_all()
+        for f, p in GPIO_ITEMS:
+            lines.append(f"{f:<5} GPIO{p}: {'ON' if states[p] else 'OFF'}")
 
-    print("--------------------")
+    lines.append("--------------------")
 
     summary = Telemetry.power_summary()
     if not summary:
-        print("Power: n/a")
-        return
-
-    print(f"Source    : {summary['source']}")
-    print(f"Status    : {summary['status']}")
-    print(f"Capacity  : {summary['capacity']}%")
-    print(f"Direction : {summary['direction']}")
-    print(f"Mode      : {summary['mode']}")
-    print(f"Voltage   : {summary['voltage']} V")
-    print(f"Current   : {summary['current']} A")
-    print(f"Power     : {summary['power']} W")
+        lines.append("Power: n/a")
+    else:
+        lines += [
+            f"Source    : {summary['source']}",
+            f"Status    : {summary['status']}",
+            f"Capacity  : {summary['capacity']}%",
+            f"Direction : {summary['direction']}",
+            f"Mode      : {summary['mode']}",
+            f"Voltage   : {summary['voltage']} V",
+            f"Current   : {summary['current']} A",
+            f"Power     : {summary['power']} W",
+        ]
+
+    # One write: the whole snapshot lands in a single flush and can't
+    # interleave with other processes sharing the terminal
+    sys.stdout.write("\n".join(lines) + "\n")
 
 # ==============================
 # Sampling / Measurement
 # ==============================
-def sample_battery_power(seconds=3.0, interval=0.2):
-    currents, powers = [], []
-    voltage = None
+def tick_sleep(next_t, interval):
+    """Sleep until the next absolute deadline; returns the following one.
 
-    end = time.time() + seconds
-    while time.time() < end:
+    Deadline-based pacing keeps the loop period at `interval` regardless of
+    how long the tick's work took, instead of drifting by work + interval.
+    """
+    next_t += interval
+    delay = next_t - time.monotonic()
+    if delay > 0:
+        time.sleep(delay)
+    else:
+        # Overran the deadline; restart the schedule from now
+        next_t = time.monotonic()
+    return next_t
+
+
+def sample_battery_power(seconds=3.0, interval=0.2, settle_early=False):
+    # Single-pass accumulators instead of lists + statistics: O(1) memory,
+    # one update per sample. Power uses Welford's recurrence so the spread
+    # comes out of the same pass as the mean.
+    voltage = None
+    current_sum = 0.0
+    power_mean = 0.0
+    power_m2 = 0.0
+    n = 0
+
+    # Deadline-paced on the monotonic clock: sample count matches the
+    # nominal rate and wall-clock jumps (e.g. --sync-rtc) can't skew the
+    # measurement window
+    start = time.monotonic()
+    next_t = start
+    while time.monotonic() - start < seconds:
         viw = Telemetry.battery_v_i_w()
         if viw:
             voltage = viw["voltage"]
-            currents.append(viw["current"])
-            powers.append(viw["power"])
-        time.sleep(interval)
-
-    if not currents:
+            current_sum += viw["current"]
+            p = viw["power"]
+            n += 1
+            d = p - power_mean
+            power_mean += d / n
+            power_m2 += d * (p - power_mean)
+
+            # A flat reading won't get any flatter; once the variance has
+            # settled below the noise floor, the remaining window adds
+            # nothing but wall time
+            if (
+                settle_early
+                and n >= 10
+                and power_m2 / n < 0.0025
+                and time.monotonic() - start > 1.0
+            ):
+                break
+        next_t = tick_sleep(next_t, interval)
+
+    if not n:
         return None
 
     return {
         "voltage": voltage,
-        "current_mean": round(mean(currents), 2),
-        "power_mean": round(mean(powers), 2),
-        "samples": len(currents),
+        "current_mean": round(current_sum / n, 2),
+        "power_mean": round(power_mean, 2),
+        "power_sd": round((power_m2 / n) ** 0.5, 3),
+        "samples": n,
     }
 
 def measure_feature(feature, seconds=3.0, settle=1.0, interval=0.2):
@@ -909,24 +1341,31 @@ def measure_feature(feature, seconds=3.0, settle=1.0, interval=0.2):
         print(f"Unknown feature '{feature}'")
         return 2
 
+    # The measurement is a battery-current delta; with the charger plugged
+    # in the draw lands on the AC rail and both windows read the same.
+    if Telemetry.ac_online():
+        print("AC power is online - battery draw does not reflect feature load.")
+        print("Unplug the charger and re-run the measurement.")
+        return 2
+
     pin = GPIO_MAP[feature]
     orig = GpioController.get_gpio(pin)
 
     print(f"Measure: {feature} (GPIO{pin})")
-    print(f"Power source: {'AC online' if Telemetry.ac_online() else 'Battery'}")
+    print("Power source: Battery")
     print(f"Current state: {'ON' if orig else 'OFF'}")
 
     if orig:
-        on = sample_battery_power(seconds, interval)
+        on = sample_battery_power(seconds, interval, settle_early=True)
         GpioController.set_feature(feature, False)
         time.sleep(settle)
-        off = sample_battery_power(seconds, interval)
+        off = sample_battery_power(seconds, interval, settle_early=True)
         GpioController.set_feature(feature, True)
     else:
-        off = sample_battery_power(seconds, interval)
+        off = sample_battery_power(seconds, interval, settle_early=True)
         GpioController.set_feature(feature, True)
         time.sleep(settle)
-        on = sample_battery_power(seconds, interval)
+        on = sample_battery_power(seconds, interval, settle_early=True)
         GpioController.set_feature(feature, False)
 
     if not on or not off:
@@ -935,8 +1374,8 @@ def measure_feature(feature, seconds=3.0, settle=1.0, interval=0.2):
 
     print("\nResults")
     print("----------------")
-    print(f"OFF: {off['power_mean']:.2f} W")
-    print(f"ON : {on['power_mean']:.2f} W")
+    print(f"OFF: {off['power_mean']:.2f} W (±{off['power_sd']:.2f})")
+    print(f"ON : {on['power_mean']:.2f} W (±{on['power_sd']:.2f})")
     print(f"Δ   {on['power_mean'] - off['power_mean']:+.2f} W")
     return 0
 
@@ -944,54 +1383,78 @@ def measure_feature(feature, seconds=3.0, settle=1.0, interval=0.2):
 # Live modes
 # ==============================
 def show_power_live():
+    # Local bindings skip the repeated global/attribute lookups in the loop
+    get_summary = Telemetry.snapshot
+    write = sys.stdout.write
+
     try:
+        next_t = time.monotonic()
         while True:
-            summary = Telemetry.power_summary()
-            os.system("clear")
-            print("Power Monitor (Ctrl+C)")
-            print("----------------------")
+            summary = get_summary()
 
+            # Build the whole frame and emit clear + text as one write so
+            # each tick costs a single stdout flush with no partial redraws
             if not summary:
-                print("Telemetry unavailable")
+                frame = (
+                    "Power Monitor (Ctrl+C)\n"
+                    "----------------------\n"
+                    "Telemetry unavailable\n"
+                )
             else:
-                print(f"Source: {summary['source']} | {summary['status']}")
-                print(
+                frame = (
+                    "Power Monitor (Ctrl+C)\n"
+                    "----------------------\n"
+                    f"Source: {summary['source']} | {summary['status']}\n"
                     f"Battery: {summary['capacity']}% | "
-                    f"{summary['current']} A ({summary['direction']})"
-                )
-                print(
+                    f"{summary['current']} A ({summary['direction']})\n"
                     f"Battery rail: {summary['voltage']} V | "
-                    f"{summary['power']} W"
+                    f"{summary['power']} W\n"
+                    f"Mode: {summary['mode']}\n"
                 )
-                print(f"Mode: {summary['mode']}")
 
-            time.sleep(1)
+            write(CLEAR_SCREEN + frame)
+            sys.stdout.flush()
+
+            next_t = tick_sleep(next_t, 1.0)
     except KeyboardInterrupt:
         pass
 
 def show_watch():
+    # Line templates are built once; each tick is a single .format() fill
+    # instead of a list comprehension + join + f-string concatenation
+    onoff = ("OFF", "ON")
+    gpio_template = "  ".join(f + ":{}" for f, _ in GPIO_ITEMS)
+    power_template = gpio_template + "  Src:{}  Batt:{}  {}%  {:.2f}W"
+    na_template = gpio_template + "  Power:n/a"
+
+    # Local bindings skip the repeated global/attribute lookups in the loop
+    items = GPIO_ITEMS
+    read_all = GpioController.read_all
+    get_summary = Telemetry.snapshot
+
     try:
+        next_t = time.monotonic()
         while True:
-            states = [
-                f"{f}:{'ON' if GpioController.get_gpio(p) else 'OFF'}"
-                for f, p in GPIO_MAP.items()
-            ]
+            by_pin = read_all()
+            gpio_states = tuple(onoff[by_pin[p]] for _, p in items)
 
-            summary = Telemetry.power_summary()
+            summary = get_summary()
             if summary:
                 print(
-                    "  ".join(states)
-                    + f"  Src:{summary['source']}"
-                    + f"  Batt:{summary['status']}"
-                    + f"  {summary['capacity']}%"
-                    + f"  {summary['power']:.2f}W",
+                    power_template.format(
+                        *gpio_states,
+                        summary["source"],
+                        summary["status"],
+                        summary["capacity"],
+                        summary["power"],
+                    ),
                     end="\r",
                     flush=True,
                 )
             else:
-                print("  ".join(states) + "  Power:n/a", end="\r", flush=True)
+                print(na_template.format(*gpio_states), end="\r", flush=True)
 
-            time.sleep(1)
+            next_t = tick_sleep(next_t, 1.0)
     except KeyboardInterrupt:
         pass
 
@@ -1019,7 +1482,10 @@ def run_gui():
             QWidget, QVBoxLayout, QLabel, QCheckBox
         )
         from PyQt6.QtGui import QAction, QIcon, QCursor
-        from PyQt6.QtCore import Qt, QTimer, QSharedMemory
+        from PyQt6.QtCore import (
+            Qt, QTimer, QSocketNotifier,
+            QThreadPool, QRunnable, QObject, pyqtSignal,
+        )
     except ImportError:
         print("PyQt6 is not installed.")
         print("Install it with:")
@@ -1030,11 +1496,27 @@ def run_gui():
     app.setQuitOnLastWindowClosed(False)
     app.setDesktopFileName("aiov2_ctl")
 
-    shared = QSharedMemory("aiov2_ctl_gui")
-    if not shared.create(1):
+    # Single-instance guard via flock: the kernel releases the lock when
+    # the process dies, so a crashed GUI never leaves a stale segment
+    # behind the way QSharedMemory can. The fd must stay referenced for
+    # the app's lifetime.
+    lock_path = os.path.expanduser("~/.cache/aiov2_ctl/gui.lock")
+    os.makedirs(os.path.dirname(lock_path), exist_ok=True)
+    lock_fd = os.open(lock_path, os.O_RDWR | os.O_CREAT, 0o644)
+    try:
+        fcntl.flock(lock_fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except OSError:
         print("AIOv2 GUI already running.")
+        os.close(lock_fd)
         return
 
+    # Own the GPIO lines for the app's lifetime; opening here, on the GUI
+    # thread, also means pool workers never race the first request.
+    # release_lines re-asserts the rails via pinctrl on quit so they
+    # survive the request teardown.
+    GpioController.hold_lines()
+    app.aboutToQuit.connect(GpioController.release_lines)
+
     tray = QSystemTrayIcon()
 
     # 1) Prefer installed PCB icon (system-wide asset path)
@@ -1069,13 +1551,19 @@ def run_gui():
     update_action = QAction("Checking for updates…")
     update_action.setEnabled(False)
 
+    # One receiver shared by every rail action and checkbox; the feature
+    # name rides on the sender widget instead of a per-widget closure
+    class FeatureToggler(QObject):
+        def toggle(self, checked):
+            GpioController.set_feature(self.sender().property("feature"), checked)
+
+    toggler = FeatureToggler()
 
     for f in GPIO_MAP:
         a = QAction(f)
         a.setCheckable(True)
-        a.triggered.connect(
-            lambda checked, f=f: GpioController.set_feature(f, checked)
-        )
+        a.setProperty("feature", f)
+        a.triggered.connect(toggler.toggle)
         menu.addAction(a)
         actions[f] = a
 
@@ -1100,6 +1588,10 @@ def run_gui():
                     QSystemTrayIcon.MessageIcon.Warning,
                     5000,
                 )
+            # The action flipped itself optimistically; drop the cached
+            # widget state so the refresh re-applies the real one even
+            # when the config didn't change (the sudo-denied case above)
+            applied.pop(f, None)
             refresh()
 
         a.triggered.connect(on_boot_toggled)
@@ -1132,42 +1624,121 @@ def run_gui():
     checkboxes = {}
     for f in GPIO_MAP:
         cb = QCheckBox(f)
-        cb.toggled.connect(
-            lambda checked, f=f: GpioController.set_feature(f, checked)
-        )
+        cb.setProperty("feature", f)
+        cb.toggled.connect(toggler.toggle)
         layout.addWidget(cb)
         checkboxes[f] = cb
 
-    def refresh():
-        summary = Telemetry.power_summary()
-        rails_on_boot = get_rails_on_boot_config(system_only=True)
+    # The gather half of a refresh (sysfs, GPIO, config files) runs on the
+    # global thread pool so the event loop never blocks behind it; results
+    # come back to the GUI thread through a queued signal.
+    pool = QThreadPool.globalInstance()
+    refresh_pending = []
+
+    # Per-feature widgets resolved once; the refresh loop then iterates a
+    # flat tuple instead of three dict lookups per pin per tick
+    widgets = tuple(
+        (f, actions[f], checkboxes[f], boot_actions[f]) for f, _ in GPIO_ITEMS
+    )
+
+    class RefreshSignals(QObject):
+        done = pyqtSignal(object, object, object)
+
+    class RefreshJob(QRunnable):
+        def __init__(self, use_cache):
+            super().__init__()
+            self.use_cache = use_cache
+
+        def run(self):
+            summary = None
+            gpio_states = None
+            rails_on_boot = None
+            try:
+                summary = Telemetry.snapshot()
+                # Timer ticks serve GPIO state from the in-process shadow;
+                # a real hardware resync happens when the window is
+                # brought up
+                gpio_states = GpioController.get_states(use_cache=self.use_cache)
+                rails_on_boot = get_rails_on_boot_config(system_only=True)
+            finally:
+                # Always emit: a throw that skipped the signal would leave
+                # refresh_pending set and freeze every future refresh
+                refresh_signals.done.emit(summary, gpio_states, rails_on_boot)
+
+    # Last state pushed into the widgets, so unchanged ticks skip the
+    # setChecked/setText calls (and the style invalidation behind them)
+    applied = {}
+
+    def apply_refresh(summary, gpio_states, rails_on_boot):
+        refresh_pending.clear()
+
         if summary:
-            power_label.setText(
+            label_text = (
                 f"{summary['mode']} | {summary['power']} W | {summary['capacity']}%"
             )
-            power_action.setText(f"Power: {summary['power']} W")
+            action_text = f"Power: {summary['power']} W"
         else:
-            power_label.setText("Power: n/a")
-            power_action.setText("Power: n/a")
+            label_text = "Power: n/a"
+            action_text = "Power: n/a"
+
+        if applied.get("label") != label_text:
+            applied["label"] = label_text
+            power_label.setText(label_text)
+        if applied.get("power") != action_text:
+            applied["power"] = action_text
+            power_action.setText(action_text)
+
+        # A failed gather emits with None payloads just to clear the
+        # pending flag; keep the widgets on their last good state
+        if gpio_states is None or rails_on_boot is None:
+            return
+
+        for f, action, checkbox, boot_action in widgets:
+            state = gpio_states[f]
+            boot = bool(rails_on_boot.get(f, False))
+            if applied.get(f) == (state, boot):
+                continue
+            applied[f] = (state, boot)
 
-        for f, p in GPIO_MAP.items():
-            state = GpioController.get_gpio(p)
+            checkbox.blockSignals(True)
+            checkbox.setChecked(state)
+            checkbox.blockSignals(False)
 
-            checkboxes[f].blockSignals(True)
-            checkboxes[f].setChecked(state)
-            checkboxes[f].blockSignals(False)
+            action.blockSignals(True)
+            action.setChecked(state)
+            action.blockSignals(False)
 
-            actions[f].blockSignals(True)
-            actions[f].setChecked(state)
-            actions[f].blockSignals(False)
+            boot_action.blockSignals(True)
+            boot_action.setChecked(boot)
+            boot_action.blockSignals(False)
 
-            boot_actions[f].blockSignals(True)
-            boot_actions[f].setChecked(bool(rails_on_boot.get(f, False)))
-            boot_actions[f].blockSignals(False)
+    refresh_signals = RefreshSignals()
+    refresh_signals.done.connect(apply_refresh)
+
+    def refresh(use_cache=True):
+        # Collapse bursts: one in-flight gather job at a time
+        if refresh_pending:
+            return
+        refresh_pending.append(True)
+        pool.start(RefreshJob(use_cache))
+
+    def refresh_fast():
+        # Hidden-window tick: keep the tray menu's power line fresh without
+        # touching GPIO state or the window widgets
+        summary = Telemetry.snapshot()
+        text = f"Power: {summary['power']} W" if summary else "Power: n/a"
+        if applied.get("power") != text:
+            applied["power"] = text
+            power_action.setText(text)
+
+    timer = QTimer()
 
     def on_activate(reason):
         if reason == QSystemTrayIcon.ActivationReason.Trigger:
-            refresh()
+            # Resync from hardware in case another aiov2_ctl invocation
+            # toggled a rail behind our back
+            refresh(use_cache=False)
+            timer.setInterval(1000)
             window.move(QCursor.pos())
             window.show()
             window.raise_()
@@ -1175,9 +1746,57 @@ def run_gui():
 
     tray.activated.connect(on_activate)
 
-    timer = QTimer()
-    timer.timeout.connect(refresh)
-    timer.start(1000)
+    # Power-supply drivers broadcast a kobject uevent whenever charge state
+    # changes; refreshing on those events lets the fallback timer run coarse
+    # instead of polling sysfs hard at 1 Hz.
+    uevent_notifier = None
+    try:
+        import socket
+
+        NETLINK_KOBJECT_UEVENT = 15
+        uevent_sock = socket.socket(
+            socket.AF_NETLINK, socket.SOCK_DGRAM, NETLINK_KOBJECT_UEVENT
+        )
+        uevent_sock.bind((os.getpid(), 1))
+        uevent_sock.setblocking(False)
+
+        def on_uevent():
+            refresh_needed = False
+            while True:
+                try:
+                    data = uevent_sock.recv(4096)
+                except OSError:
+                    break
+                if b"power_supply" in data:
+                    refresh_needed = True
+            if refresh_needed:
+                if window.isVisible():
+                    refresh()
+                else:
+                    refresh_fast()
+
+        uevent_notifier = QSocketNotifier(
+            uevent_sock.fileno(), QSocketNotifier.Type.Read
+        )
+        uevent_notifier.activated.connect(on_uevent)
+        hidden_interval = 10000
+    except OSError:
+        hidden_interval = 5000
+
+    def on_tick():
+        # The full refresh only runs while someone can see the window;
+        # hidden ticks downshift to the cheap tray-only update
+        if window.isVisible():
+            if timer.interval() != 1000:
+                timer.setInterval(1000)
+            refresh()
+        else:
+            if timer.interval() != hidden_interval:
+                timer.setInterval(hidden_interval)
+            refresh_fast()
+
+    timer.timeout.connect(on_tick)
+    timer.start(hidden_interval)
 
 
     def update_check():
@@ -1227,6 +1846,9 @@ def run_gui():
 
 
 def install_self():
+    import json
+    import shutil
+
     if os.geteuid() != 0:
         print("Install requires sudo.")
         print("Run: sudo aiov2_ctl --install")
@@ -1278,16 +1900,18 @@ def install_self():
     if src_real == dst_real:
         print("Executable already installed, skipping copy.\n")
     else:
-        subprocess.check_call(["cp", src, dst])
-        subprocess.check_call(["chmod", "+x", dst])
+        shutil.copy2(src, dst)
+        os.chmod(dst, 0o755)
 
     # ------------------------------
     # Install assets (icons, etc.)
     # ------------------------------
     if img_src and os.path.isdir(img_src):
         print(f"Installing assets → {asset_base}\n")
-        subprocess.check_call(["mkdir", "-p", asset_base])
-        subprocess.check_call(["cp", "-r", img_src, asset_base])
+        os.makedirs(asset_base, exist_ok=True)
+        shutil.copytree(
+            img_src, os.path.join(asset_base, "img"), dirs_exist_ok=True
+        )
     else:
         print("No assets found, skipping.\n")
 
@@ -1356,6 +1980,8 @@ def update_self():
         print("Git pull failed. Resolve manually.")
         return 1
 
+    invalidate_update_check_cache()
+
     print("\nReinstalling updated version…\n")
 
     report_and_disable_mesh_autostart_if_default("Meshtastic boot config status:")
@@ -1436,8 +2062,45 @@ def check_update_interactive():
         return 0
 
 
+def load_cached_update_check():
+    import json
+
+    try:
+        with open(UPDATE_CHECK_CACHE_PATH) as f:
+            cache = json.load(f)
+        if time.time() - cache["ts"] < UPDATE_CHECK_TTL:
+            return int(cache["behind"])
+    except Exception:
+        pass
+    return None
+
+
+def save_cached_update_check(behind):
+    import json
+
+    try:
+        os.makedirs(os.path.dirname(UPDATE_CHECK_CACHE_PATH), exist_ok=True)
+        with open(UPDATE_CHECK_CACHE_PATH, "w") as f:
+            json.dump({"ts": time.time(), "behind": behind}, f)
+    except OSError:
+        pass
+
+
+def invalidate_update_check_cache():
+    try:
+        os.remove(UPDATE_CHECK_CACHE_PATH)
+    except OSError:
+        pass
+
+
 def check_update_available(repo):
     """Quick check if updates are available (used by GUI)."""
+    # The fetch is the expensive part (network); a recent answer is good
+    # enough for the GUI's periodic probe
+    cached = load_cached_update_check()
+    if cached is not None:
+        return cached > 0
+
     try:
         meta = load_install_meta()
         branch = "main"
@@ -1461,52 +2124,65 @@ def check_update_available(repo):
             text=True,
         ).strip()
 
-        return int(behind) > 0
+        behind = int(behind)
+        save_cached_update_check(behind)
+        return behind > 0
     except Exception:
         return False
 
 # ==============================
 # Entrypoint
 # ==============================
+# Simple commands dispatch through one hash lookup; options that take extra
+# positional arguments keep their dedicated branches in main()
+DISPATCH = {
+    "--help": lambda: print(help_text()),
+    "-h": lambda: print(help_text()),
+    "--install": lambda: sys.exit(install_self()),
+    "--update": lambda: sys.exit(update_self()),
+    "--check-update": lambda: sys.exit(check_update_interactive()),
+    "--status": show_status,
+    "--power": show_power_live,
+    "--watch": show_watch,
+    "--gui": run_gui,
+    "--autostart": lambda: sys.exit(enable_autostart()),
+    "--no-autostart": lambda: sys.exit(disable_autostart()),
+    "--mesh-off-boot": lambda: apply_mesh_on_boot(False),
+    "--boot-rails-status": print_rails_on_boot_status,
+    "--apply-boot-rails": lambda: sys.exit(apply_rails_on_boot()),
+    "--add-apps": lambda: sys.exit(add_apps()),
+    "--remove-apps": lambda: sys.exit(remove_apps()),
+    "--sync-rtc": lambda: sys.exit(sync_rtc()),
+}
+
+
 def main():
     if len(sys.argv) == 1:
-        for f, p in GPIO_MAP.items():
-            print(f"{f}: {'ON' if GpioController.get_gpio(p) else 'OFF'}")
+        # Most-invoked entry point: one batched read, one stdout write
+        states = GpioController.get_states()
+        sys.stdout.write(
+            "".join(f"{f}: {'ON' if states[f] else 'OFF'}\n" for f in GPIO_MAP)
+        )
         return
 
     arg = sys.argv[1]
 
-    if arg in ("--help", "-h"):
-        print(HELP_TEXT)
-
-    elif arg == "--install":
-        sys.exit(install_self())
-
-    elif arg == "--update":
-        sys.exit(update_self())
-
-    elif arg == "--check-update":
-        sys.exit(check_update_interactive())
-
-    elif arg == "--status":
-        show_status()
-
-    elif arg == "--power":
-        show_power_live()
-
-    elif arg == "--watch":
-        show_watch()
-
-    elif arg == "--gui":
-        run_gui()
-
-    elif arg == "--autostart":
-        sys.exit(enable_autostart())
+    # Fast path for the other everyday invocation: 'aiov2_ctl GPS on'
+    # toggles without walking the option branches
+    if len(sys.argv) == 3 and arg.upper() in GPIO_MAP:
+        state = sys.argv[2].lower()
+        if state not in ("on", "off"):
+            print("Use --help")
+            sys.exit(1)
+        GpioController.set_feature(arg.upper(), state == "on")
+        return
 
-    elif arg == "--no-autostart":
-        sys.exit(disable_autostart())
+    handler = DISPATCH.get(arg)
+    if handler:
+        handler()
+        return
 
-    elif arg == "--mesh-on-boot":
+    if arg == "--mesh-on-boot":
         state = None
         if len(sys.argv) > 2 and sys.argv[2].lower() in ("on", "off", "status"):
             state = sys.argv[2].lower()
@@ -1518,9 +2194,6 @@ def main():
         else:
             apply_mesh_on_boot(True)
 
-    elif arg == "--mesh-off-boot":
-        apply_mesh_on_boot(False)
-
     elif arg == "--boot-rail":
         if len(sys.argv) < 4:
             print("Usage: aiov2_ctl --boot-rail <FEATURE> on|off|status")
@@ -1542,21 +2215,6 @@ def main():
             set_feature_on_boot(feature, state == "on")
             print(f"{feature} boot state set to {'ON' if state == 'on' else 'OFF'}")
 
-    elif arg == "--boot-rails-status":
-        print_rails_on_boot_status()
-
-    elif arg == "--apply-boot-rails":
-        sys.exit(apply_rails_on_boot())
-
-    elif arg == "--add-apps":
-        sys.exit(add_apps())
-
-    elif arg == "--remove-apps":
-        sys.exit(remove_apps())
-
-    elif arg == "--sync-rtc":
-        sys.exit(sync_rtc())
-
     elif arg == "--measure":
         if len(sys.argv) < 3:
             print("Usage: aiov2_ctl --measure <FEATURE> [--seconds N] [--interval S] [--settle S]")
@@ -1596,14 +2254,11 @@ def main():
         sys.exit(measure_feature(feature, **kwargs))
 
     elif len(sys.argv) == 3:
-        feature = arg.upper()
-        state = sys.argv[2].lower()
-
-        if feature not in GPIO_MAP or state not in ("on", "off"):
-            print("Use --help")
-            sys.exit(1)
-
-        GpioController.set_feature(feature, state == "on")
+        # Unknown feature in the three-argument form: the valid ones were
+        # consumed by the fast path above, so this exits nonzero like the
+        # original validation did
+        print("Use --help")
+        sys.exit(1)
 
     else:
         print("Use --help")